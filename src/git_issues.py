@@ -28,11 +28,39 @@ The module is self-contained and does not require the rest of the service.
 
 from __future__ import annotations
 
+import codecs
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
+import functools
 import json
+import math
 import os
 from pathlib import Path
-from typing import List, MutableMapping, MutableSequence, Sequence
+import re
+import shutil
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+)
+
+try:  # pragma: no cover - exercised depending on the installed extras
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # pragma: no cover - exercised depending on the installed extras
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
 
 
 DEFAULT_ISSUE_FILE_CANDIDATES: Sequence[str] = (
@@ -43,30 +71,131 @@ DEFAULT_ISSUE_FILE_CANDIDATES: Sequence[str] = (
     "Git Issues.json",
 )
 
+# Set view of the default candidates for cheap ``name in ...`` tests.
+_DEFAULT_CANDIDATES_SET: frozenset[str] = frozenset(DEFAULT_ISSUE_FILE_CANDIDATES)
+# Lower-cased variant used to match candidates regardless of their casing.
+_DEFAULT_CANDIDATES_CI: frozenset[str] = frozenset(
+    candidate.lower() for candidate in DEFAULT_ISSUE_FILE_CANDIDATES
+)
 
-def _normalise_status(status: str | None) -> str:
-    """Return a lower-case status name.
+# Runs of 19+ digits may be integers outside orjson's 64-bit range, which it
+# would silently decode as floats; such documents go to the stdlib decoder.
+_LONG_NUMBER = re.compile(rb"\d{19,}")
+
+
+def _stdlib_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _has_non_finite_float(obj: object) -> bool:
+    """Return whether ``obj`` holds a ``NaN`` or infinite float at any depth."""
+
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _stdlib_dumps(obj: object) -> bytes:
+    return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True).encode(
+        "utf-8"
+    )
+
+
+if orjson is not None:
+
+    def _loads(data: bytes) -> Any:
+        if _LONG_NUMBER.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Possibly stdlib-only syntax such as ``NaN``; let the stdlib
+                # decoder accept it or raise its own error.
+                pass
+        return _stdlib_loads(data)
+
+    def _dumps(obj: object) -> bytes:
+        try:
+            payload = orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits and other values orjson cannot encode.
+            return _stdlib_dumps(obj)
+        # orjson writes NaN/Infinity as ``null``; only payloads that contain a
+        # ``null`` need the slower check for such floats.
+        if b"null" in payload and _has_non_finite_float(obj):
+            return _stdlib_dumps(obj)
+        return payload
+
+else:
+    _loads = _stdlib_loads
+    _dumps = _stdlib_dumps
+
+
+# Repository root (two levels above this module), resolved lazily once.
+_MODULE_ROOT: Path | None = None
+
+# Parsed issues served by :func:`load_issues_readonly`, keyed by file path and
+# validated against ``(st_ino, st_mtime_ns, st_size)`` on every lookup.  The
+# inode changes on every ``save_issues`` (it writes through ``os.replace``),
+# which catches rewrites that coarse mtimes would miss.  At most
+# ``_ISSUES_CACHE_MAXSIZE`` files are kept, least recently used first out.
+_ISSUES_CACHE_MAXSIZE = 8
+_ISSUES_CACHE: dict[
+    Path, tuple[tuple[int, int, int], tuple[MutableMapping[str, object], ...]]
+] = {}
+
+# Auto-discovered file of the last argument-less :func:`find_issues_file`
+# call (``GIT_ISSUES_FILE`` is still honoured before it is consulted).
+_resolver: Callable[[], Path] | None = None
+
+# Statuses treated as "open" by :func:`list_open_issues`.
+_OPEN_STATUSES: frozenset[str] = frozenset(
+    {"open", "opened", "todo", "backlog", "in_progress"}
+)
+# Subset of open statuses that :func:`complete_open_issues` transitions.
+_COMPLETABLE_STATUSES: frozenset[str] = frozenset({"open", "opened"})
 
-    The helper accepts ``None`` because some issues might miss the status key
-    or tests could rely on a different name (``state``).  In that situation we
-    simply return an empty string which allows the caller to treat the entry
-    as non matching for status comparisons.
-    """
+# Issues files larger than this are streamed with ``ijson`` when available.
+_STREAMING_THRESHOLD = 1 << 20
 
-    if status is None:
-        return ""
-    return status.strip().lower()
+# Maximum directory depth (relative to the search root) explored by the
+# fallback walk in :func:`find_issues_file`.
+_MAX_SEARCH_DEPTH = 2
 
 
 def _ensure_status_key(issue: MutableMapping[str, object], new_status: str) -> None:
     """Update both ``status`` and ``state`` fields to ``new_status``.
 
     The GitHub API uses ``state`` while custom exports might use ``status``.
-    The helper makes sure the two stay in sync when we mutate an issue.
+    The helper makes sure the two stay in sync when we mutate an issue and
+    leaves the mapping untouched when both already match.
     """
 
-    issue["status"] = new_status
-    issue["state"] = new_status
+    get = issue.get
+    if get("status") != new_status or get("state") != new_status:
+        issue["status"] = issue["state"] = new_status
+
+
+def _module_root() -> Path:
+    """Return the repository root, resolving it on first use only."""
+
+    global _MODULE_ROOT
+
+    if _MODULE_ROOT is None:
+        _MODULE_ROOT = Path(__file__).resolve().parents[1]
+    return _MODULE_ROOT
 
 
 def _timestamp() -> str:
@@ -93,8 +222,17 @@ def find_issues_file(
         repository root (two levels above this module).
     candidates:
         Filenames that are checked relative to ``search_root``.
+
+    ``GIT_ISSUES_FILE`` is checked on every call.  Auto-discovery results are
+    memoised per ``(search_root, candidates)`` so that batch workflows do not
+    walk the tree repeatedly, and argument-less calls reuse the last
+    resolution directly.  A memoised file that no longer exists triggers a
+    fresh discovery; :func:`reset_resolver` (or
+    ``find_issues_file.cache_clear()``) forgets every memoised result.
     """
 
+    global _resolver
+
     if explicit_path is not None:
         path = Path(explicit_path)
         if not path.is_file():
@@ -107,56 +245,308 @@ def find_issues_file(
         if path.is_file():
             return path
 
+    default_lookup = search_root is None and candidates is DEFAULT_ISSUE_FILE_CANDIDATES
+    if default_lookup and _resolver is not None:
+        resolved = _resolver()
+        if resolved.is_file():
+            return resolved
+
     if search_root is None:
-        search_root = Path(__file__).resolve().parents[1]
+        search_root = _module_root()
+
+    key = (str(search_root), tuple(candidates))
+    resolved = _find_issues_file_uncached(*key)
+    if not resolved.is_file():
+        # The memoised file went away since it was discovered; look again.
+        reset_resolver()
+        resolved = _find_issues_file_uncached(*key)
+    if default_lookup:
+
+        def resolver(path: Path = resolved) -> Path:
+            return path
+
+        _resolver = resolver
+    return resolved
 
-    root_path = Path(search_root)
-    for candidate in candidates:
-        candidate_path = root_path / candidate
-        if candidate_path.is_file():
-            return candidate_path
+
+@functools.lru_cache(maxsize=32)
+def _find_issues_file_uncached(
+    search_root: str,
+    candidates: tuple[str, ...],
+) -> Path:
+    """Discover the issues file; memoised by :func:`find_issues_file`."""
+
+    if candidates == DEFAULT_ISSUE_FILE_CANDIDATES:
+        exact, folded = _DEFAULT_CANDIDATES_SET, _DEFAULT_CANDIDATES_CI
+    else:
+        exact = frozenset(candidates)
+        folded = frozenset(candidate.lower() for candidate in candidates)
+
+    # A single directory listing replaces one ``stat`` per candidate name.
+    found, git_dir = _scan_directory(search_root, candidates, exact, folded)
+    if found is not None:
+        return found
 
     # Some tests might place the file inside the .git directory; search there
     # too to be more permissive.
-    git_dir = root_path / ".git"
-    if git_dir.exists():
-        for candidate in candidates:
-            candidate_path = git_dir / candidate
-            if candidate_path.is_file():
-                return candidate_path
+    if git_dir is not None:
+        found, _ = _scan_directory(git_dir, candidates, exact, folded)
+        if found is not None:
+            return found
 
     # Fallback to a broader search: walk at most two directory levels to find
     # any file that matches the candidate names.  This keeps the function fast
     # for small repositories while still being permissive for tests.
-    for path in root_path.rglob("*.json"):
-        if path.name in candidates:
-            return path
+    found = _walk_for_candidates(Path(search_root), exact, folded)
+    if found is not None:
+        return found
 
     raise FileNotFoundError("Unable to locate a Git Issues JSON file")
 
 
-def load_issues(file_path: str | os.PathLike[str] | None = None) -> List[MutableMapping[str, object]]:
-    """Load issues from the JSON file.
+def _scan_directory(
+    directory: str,
+    candidates: Sequence[str],
+    exact: frozenset[str],
+    folded: frozenset[str],
+) -> tuple[Path | None, str | None]:
+    """List ``directory`` once and report what :func:`find_issues_file` needs.
 
-    ``file_path`` can point directly to the issues file.  When omitted we try
-    to find the file automatically via :func:`find_issues_file`.
+    Returns the preferred candidate file, if any, plus the path of the
+    ``.git`` subdirectory when there is one.  Exact filename matches win over
+    case-insensitive ones; within each group ``candidates`` order decides.
+    """
+
+    exact_hits: dict[str, str] = {}
+    folded_hits: dict[str, str] = {}
+    git_dir: str | None = None
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name in exact:
+                    if entry.is_file():
+                        exact_hits[name] = entry.path
+                elif name == ".git":
+                    if entry.is_dir():
+                        git_dir = entry.path
+                elif name.lower() in folded and entry.is_file():
+                    folded_hits.setdefault(name.lower(), entry.path)
+    except OSError:
+        pass
+
+    for candidate in candidates:
+        if candidate in exact_hits:
+            return Path(exact_hits[candidate]), git_dir
+    for candidate in candidates:
+        path = folded_hits.get(candidate.lower())
+        if path is not None:
+            return Path(path), git_dir
+
+    return None, git_dir
+
+
+def _walk_for_candidates(
+    root_path: Path, exact: frozenset[str], folded: frozenset[str]
+) -> Path | None:
+    """Breadth-first search for candidate files below ``root_path``.
+
+    The walk uses :func:`os.scandir` so the file type comes from the cached
+    directory entry instead of an extra ``stat`` per file, does not follow
+    directory symlinks and stops at ``_MAX_SEARCH_DEPTH`` levels.  Names are
+    compared exactly first and only lower-cased on a miss.
+    """
+
+    queue: deque[tuple[str, int]] = deque([(os.fspath(root_path), 0)])
+    while queue:
+        directory, depth = queue.popleft()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if (name in exact or name.lower() in folded) and entry.is_file():
+                        return Path(entry.path)
+                    if depth >= _MAX_SEARCH_DEPTH:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        queue.append((entry.path, depth + 1))
+        except OSError:
+            # Unreadable directories are skipped rather than aborting the search.
+            continue
+
+    return None
+
+
+def reset_resolver() -> None:
+    """Forget every memoised :func:`find_issues_file` resolution."""
+
+    global _resolver
+
+    _resolver = None
+    _find_issues_file_uncached.cache_clear()
+
+
+find_issues_file.cache_clear = reset_resolver  # type: ignore[attr-defined]
+
+
+def load_issues_iter(
+    file_path: str | os.PathLike[str] | None = None,
+) -> Iterator[MutableMapping[str, object]]:
+    """Yield issues from the JSON file one at a time.
+
+    The file is located eagerly (so a missing file raises immediately), while
+    parsing happens during iteration.  Files above ``_STREAMING_THRESHOLD``
+    are streamed with ``ijson`` when it is installed so that only one issue is
+    held in memory at a time; smaller files are decoded in one go.  Malformed
+    content raises :class:`ValueError`.
+
+    Streaming only pays off for consumers that do not keep every issue;
+    callers that need the whole list should use :func:`load_issues`.
     """
 
     issues_path = find_issues_file(explicit_path=file_path)
-    with issues_path.open("r", encoding="utf-8") as fp:
-        data = json.load(fp)
+    if ijson is not None and issues_path.stat().st_size > _STREAMING_THRESHOLD:
+        return _validate_issues(_stream_issues(issues_path))
 
+    return iter(_read_issues(issues_path))
+
+
+def _read_issues(issues_path: Path) -> List[MutableMapping[str, object]]:
+    """Decode the whole issues file in one go and validate its entries."""
+
+    data = _loads(issues_path.read_bytes())
     if not isinstance(data, list):
         raise ValueError("The issues file must contain a JSON list")
 
-    # Normalise issue entries so we can safely mutate them later on.
-    normalised: List[MutableMapping[str, object]] = []
+    # Every returned entry is guaranteed to be a mapping, which lets the
+    # helpers below skip per-issue type checks.
     for item in data:
         if not isinstance(item, MutableMapping):
             raise ValueError("Each issue entry must be a JSON object")
-        normalised.append(item)
+    return data
+
+
+def _stream_issues(issues_path: Path) -> Iterator[object]:
+    """Incrementally decode the top-level JSON list of ``issues_path``.
+
+    ijson is stricter than the one-shot decoder (no ``NaN``/``Infinity``).
+    When it gives up, the file is decoded in one go instead and the issues
+    not yielded yet are served from that, so the accepted input does not
+    depend on the file size; genuinely malformed files raise there.
+    """
+
+    yielded = 0
+    with issues_path.open("rb") as fp:
+        head = fp.read(4096)
+        # Skip a UTF-8 BOM, which ijson does not accept.
+        start = len(codecs.BOM_UTF8) if head.startswith(codecs.BOM_UTF8) else 0
+        # ``ijson.items`` silently yields nothing for a non-list document, so
+        # check the opening token ourselves.
+        if head[start:].lstrip()[:1] != b"[":
+            raise ValueError("The issues file must contain a JSON list")
+        fp.seek(start)
+        try:
+            for item in ijson.items(fp, "item", use_float=True):
+                yield item
+                yielded += 1
+            return
+        except ijson.JSONError:
+            pass
+
+    yield from _read_issues(issues_path)[yielded:]
+
+
+def _validate_issues(items: Iterable[object]) -> Iterator[MutableMapping[str, object]]:
+    """Yield ``items`` after checking each one is a JSON object."""
+
+    for item in items:
+        if not isinstance(item, MutableMapping):
+            raise ValueError("Each issue entry must be a JSON object")
+        yield item
+
+
+def load_issues(file_path: str | os.PathLike[str] | None = None) -> List[MutableMapping[str, object]]:
+    """Load issues from the JSON file.
+
+    ``file_path`` can point directly to the issues file.  When omitted we try
+    to find the file automatically via :func:`find_issues_file`.  The whole
+    list is built anyway, so the file is always decoded in one go.
+    """
+
+    return _read_issues(find_issues_file(explicit_path=file_path))
+
+
+def load_issues_readonly(
+    file_path: str | os.PathLike[str] | None = None,
+) -> Sequence[Mapping[str, object]]:
+    """Load issues through an in-memory cache keyed by file identity.
+
+    Repeated calls cost a single ``stat`` while the file is unchanged.  The
+    returned entries are shared between callers and **must not be mutated**;
+    use :func:`load_issues` to get a private, mutable copy.
+    """
+
+    issues_path = find_issues_file(explicit_path=file_path)
+    st = issues_path.stat()
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _ISSUES_CACHE.pop(issues_path, None)
+    if cached is not None and cached[0] == key:
+        # Re-insert so the dict order tracks recency of use.
+        _ISSUES_CACHE[issues_path] = cached
+        return cached[1]
+
+    issues = tuple(_read_issues(issues_path))
+    while len(_ISSUES_CACHE) >= _ISSUES_CACHE_MAXSIZE:
+        del _ISSUES_CACHE[next(iter(_ISSUES_CACHE))]
+    _ISSUES_CACHE[issues_path] = (key, issues)
+    return issues
+
+
+@dataclass(slots=True)
+class Issue:
+    """Compact, read-oriented view of a single issue.
+
+    Only the fields used by this module are kept; any other key from the
+    JSON entry is dropped.  Use the mapping-based helpers when issues must be
+    written back to disk.
+    """
+
+    id: int | None
+    title: str = ""
+    status: str = ""
+    state: str = ""
+    closed_at: str | None = None
+    completed_at: str | None = None
+
+    @classmethod
+    def from_mapping(cls, issue: MutableMapping[str, object]) -> Issue:
+        """Build an :class:`Issue` from a raw JSON entry."""
+
+        get = issue.get
+        return cls(
+            id=get("id"),
+            title=get("title") or "",
+            status=get("status") or "",
+            state=get("state") or "",
+            closed_at=get("closed_at"),
+            completed_at=get("completed_at"),
+        )
+
+    @property
+    def normalised_status(self) -> str:
+        """Lower-case ``status``, falling back to ``state`` when blank."""
+
+        return (self.status.strip() or self.state.strip()).lower()
+
 
-    return normalised
+def load_issues_typed(file_path: str | os.PathLike[str] | None = None) -> List[Issue]:
+    """Load issues as :class:`Issue` instances.
+
+    This is a lighter alternative to :func:`load_issues` for large files that
+    are only inspected, not saved back.
+    """
+
+    return [Issue.from_mapping(issue) for issue in load_issues_iter(file_path)]
 
 
 def save_issues(
@@ -168,15 +558,95 @@ def save_issues(
 
     The function writes the JSON file using UTF-8 and sorted keys so that the
     output is stable.  It returns the path that was written for convenience.
+    ``orjson`` is used for serialisation when installed, with the standard
+    library taking over for values it cannot represent (integers beyond 64
+    bits, ``NaN``...).  Both use the same indentation and key order, although
+    some floats are spelled differently (``1e20`` versus ``1e+20``).
+
+    The file is left untouched when its content would not change.  Otherwise
+    the payload goes to a uniquely named temporary file next to the real
+    target (symlinks are followed) that atomically replaces it, keeping the
+    original permissions, so readers never observe a half-written file.
     """
 
     issues_path = find_issues_file(explicit_path=file_path)
-    with issues_path.open("w", encoding="utf-8") as fp:
-        json.dump(list(issues), fp, indent=2, ensure_ascii=False, sort_keys=True)
-        fp.write("\n")
+    # Both encoders accept lists and tuples directly; only copy other sequences.
+    data = issues if isinstance(issues, (list, tuple)) else list(issues)
+    payload = _dumps(data) + b"\n"
+    _ISSUES_CACHE.pop(issues_path, None)
+
+    try:
+        if issues_path.read_bytes() == payload:
+            return issues_path
+    except OSError:
+        pass
+
+    # Replace the symlink target rather than the link itself, and keep the
+    # temporary file on the same filesystem so ``os.replace`` stays atomic.
+    target = issues_path.resolve()
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".tmp", dir=target.parent
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        _write_bytes(fd, payload)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return issues_path
 
 
+def _write_bytes(fd: int, payload: bytes) -> None:
+    """Write ``payload`` straight through ``fd`` and close it.
+
+    The payload is already fully encoded, so this bypasses the buffered/text
+    layers and issues a single ``write`` for typical file sizes.
+    """
+
+    try:
+        view = memoryview(payload)
+        while view:
+            # ``os.write`` may perform a partial write on large payloads.
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def iter_open_issues(
+    issues: Iterable[MutableMapping[str, object]] | None = None,
+    *,
+    file_path: str | os.PathLike[str] | None = None,
+) -> Iterator[MutableMapping[str, object]]:
+    """Yield the issues that are currently open.
+
+    Lazy counterpart of :func:`list_open_issues` for callers that only need
+    to iterate, count or stop at the first match.  When ``issues`` is omitted
+    the file is located immediately (a missing file raises here, not on the
+    first ``next()``) and read through :func:`load_issues_iter`.
+    """
+
+    if issues is None:
+        issues = load_issues_iter(file_path)
+    return _filter_open(issues)
+
+
+def _filter_open(
+    issues: Iterable[MutableMapping[str, object]],
+) -> Iterator[MutableMapping[str, object]]:
+    """Yield the open entries of ``issues``; see :func:`iter_open_issues`."""
+
+    for issue in issues:
+        # A blank ``status`` falls back to ``state``.
+        status = (
+            (issue.get("status") or "").strip() or (issue.get("state") or "").strip()
+        ).lower()
+        if status in _OPEN_STATUSES:
+            yield issue
+
+
 def list_open_issues(
     issues: Sequence[MutableMapping[str, object]] | None = None,
     *,
@@ -185,100 +655,137 @@ def list_open_issues(
     """Return a list of issues that are currently open.
 
     ``issues`` can be provided directly to skip reading the file.
-    Otherwise the function loads the issues using :func:`load_issues`.
+    Otherwise the issues are read through :func:`load_issues_iter` (via
+    :func:`iter_open_issues`), so large files are streamed and only the open
+    issues are kept in memory.
     """
 
-    if issues is None:
-        issues = load_issues(file_path)
+    return list(iter_open_issues(issues, file_path=file_path))
 
-    open_statuses = {"open", "opened", "todo", "backlog", "in_progress"}
-    result: List[MutableMapping[str, object]] = []
-    for issue in issues:
-        status = _normalise_status(
-            issue.get("status") if isinstance(issue, MutableMapping) else None
-        )
-        if not status:
-            status = _normalise_status(issue.get("state") if isinstance(issue, MutableMapping) else None)
-        if status in open_statuses:
-            result.append(issue)
 
-    return result
+# Transition tables map a normalised status to the status it moves to and
+# the timestamp field stamped on the issue.  A single ``dict.get`` per issue
+# finds the applicable rule regardless of how many rules a table holds.
+_Transitions = Mapping[str, tuple[str, str]]
 
+_TRANSITIONS_CLOSE: _Transitions = {"implemented": ("closed", "closed_at")}
+_TRANSITIONS_COMPLETE: _Transitions = {
+    status: ("completed", "completed_at") for status in _COMPLETABLE_STATUSES
+}
+_TRANSITIONS_ALL: _Transitions = {**_TRANSITIONS_CLOSE, **_TRANSITIONS_COMPLETE}
 
-def close_implemented_issues(
-    issues: MutableSequence[MutableMapping[str, object]] | None = None,
-    *,
-    file_path: str | os.PathLike[str] | None = None,
-) -> List[MutableMapping[str, object]]:
-    """Mark every implemented issue as closed.
 
-    Issues with status/state equal to ``implemented`` will be updated to the
-    ``closed`` status.  The function also stamps a ``closed_at`` field when it
-    is missing.  The updated issues sequence is returned and, if ``issues`` was
-    ``None``, the changes are saved back to the JSON file immediately.
+def _transition(
+    issues: Sequence[MutableMapping[str, object]],
+    table: _Transitions,
+) -> bool:
+    """Apply the ``table`` transitions to ``issues`` in a single pass.
+
+    All issues updated by one call share the same transition timestamp.
+    Returns ``True`` when at least one issue was updated so callers can skip
+    needless writes.
     """
 
+    ts = _timestamp()
+    dirty = False
+    for issue in issues:
+        # Status lookup is inlined: this is the hot loop for large files.
+        status = (
+            (issue.get("status") or "").strip() or (issue.get("state") or "").strip()
+        ).lower()
+        rule = table.get(status)
+        if rule:
+            new_status, ts_key = rule
+            _ensure_status_key(issue, new_status)
+            issue.setdefault(ts_key, ts)
+            dirty = True
+
+    return dirty
+
+
+def _apply_transitions(
+    issues: MutableSequence[MutableMapping[str, object]] | None,
+    file_path: str | os.PathLike[str] | None,
+    table: _Transitions,
+) -> Sequence[MutableMapping[str, object]]:
+    """Load (if needed), transition and persist issues for the public helpers."""
+
     if issues is None:
         issues = load_issues(file_path)
         persist = True
     else:
         persist = False
 
-    for issue in issues:
-        status = _normalise_status(issue.get("status") if isinstance(issue, MutableMapping) else None)
-        if not status:
-            status = _normalise_status(issue.get("state") if isinstance(issue, MutableMapping) else None)
-
-        if status == "implemented":
-            _ensure_status_key(issue, "closed")
-            issue.setdefault("closed_at", _timestamp())
+    dirty = _transition(issues, table)
 
-    if persist:
+    if persist and dirty:
         save_issues(issues, file_path=file_path)
 
-    return list(issues)
+    # Lists (including the one built by ``load_issues``) are returned as is.
+    return issues if isinstance(issues, list) else list(issues)
+
+
+def close_implemented_issues(
+    issues: MutableSequence[MutableMapping[str, object]] | None = None,
+    *,
+    file_path: str | os.PathLike[str] | None = None,
+) -> Sequence[MutableMapping[str, object]]:
+    """Mark every implemented issue as closed.
+
+    Issues with status/state equal to ``implemented`` will be updated to the
+    ``closed`` status.  The function also stamps a ``closed_at`` field when it
+    is missing.  The updated issues sequence is returned (the very list that
+    was passed in, when ``issues`` is a list) and, if ``issues`` was ``None``,
+    the changes are saved back to the JSON file immediately.
+    """
+
+    return _apply_transitions(issues, file_path, _TRANSITIONS_CLOSE)
 
 
 def complete_open_issues(
     issues: MutableSequence[MutableMapping[str, object]] | None = None,
     *,
     file_path: str | os.PathLike[str] | None = None,
-) -> List[MutableMapping[str, object]]:
+) -> Sequence[MutableMapping[str, object]]:
     """Mark every open issue as completed.
 
     Only issues with an ``open`` status/state are affected.  The helper sets
     the status to ``completed`` and fills ``completed_at`` when it is missing.
-    The updated list of issues is returned and persisted if ``issues`` was not
-    provided explicitly.
+    The updated issues sequence is returned (the very list that was passed in,
+    when ``issues`` is a list) and persisted if ``issues`` was not provided
+    explicitly.
     """
 
-    if issues is None:
-        issues = load_issues(file_path)
-        persist = True
-    else:
-        persist = False
+    return _apply_transitions(issues, file_path, _TRANSITIONS_COMPLETE)
 
-    for issue in issues:
-        status = _normalise_status(issue.get("status") if isinstance(issue, MutableMapping) else None)
-        if not status:
-            status = _normalise_status(issue.get("state") if isinstance(issue, MutableMapping) else None)
 
-        if status in {"open", "opened"}:
-            _ensure_status_key(issue, "completed")
-            issue.setdefault("completed_at", _timestamp())
+def apply_issue_transitions(
+    issues: MutableSequence[MutableMapping[str, object]] | None = None,
+    *,
+    file_path: str | os.PathLike[str] | None = None,
+) -> Sequence[MutableMapping[str, object]]:
+    """Close implemented issues and complete open ones in a single pass.
 
-    if persist:
-        save_issues(issues, file_path=file_path)
+    This is equivalent to calling :func:`close_implemented_issues` followed by
+    :func:`complete_open_issues`, but the issues are loaded, traversed and
+    written at most once.  Nothing is written when no issue changed.
+    """
 
-    return list(issues)
+    return _apply_transitions(issues, file_path, _TRANSITIONS_ALL)
 
 
 __all__ = [
+    "Issue",
     "find_issues_file",
+    "reset_resolver",
     "load_issues",
+    "load_issues_iter",
+    "load_issues_readonly",
+    "load_issues_typed",
     "save_issues",
+    "iter_open_issues",
     "list_open_issues",
     "close_implemented_issues",
     "complete_open_issues",
+    "apply_issue_transitions",
 ]
-
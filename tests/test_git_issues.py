@@ -2,12 +2,24 @@
 
 import json
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
 from src import git_issues
 
 
+@pytest.fixture(autouse=True)
+def reset_git_issues_caches() -> Iterator[None]:
+    """Isolate tests from the module-level discovery and parse caches."""
+
+    git_issues.reset_resolver()
+    git_issues._ISSUES_CACHE.clear()
+    yield
+    git_issues.reset_resolver()
+    git_issues._ISSUES_CACHE.clear()
+
+
 @pytest.fixture()
 def issues_file(tmp_path: Path) -> Path:
     data = [
@@ -47,3 +59,347 @@ def test_complete_open_issues(issues_file: Path, monkeypatch: pytest.MonkeyPatch
     assert open_issue["status"] == "completed"
     assert open_issue["state"] == "completed"
     assert "completed_at" in open_issue
+
+
+def test_find_issues_file_is_memoised(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_ISSUES_FILE", raising=False)
+    nested = tmp_path / "docs" / "git_issues.json"
+    nested.parent.mkdir()
+    nested.write_text("[]", encoding="utf-8")
+
+    assert git_issues.find_issues_file(search_root=tmp_path) == nested
+
+    def fail_walk(*args: object) -> None:
+        raise AssertionError("the tree should not be walked again")
+
+    monkeypatch.setattr(git_issues, "_walk_for_candidates", fail_walk)
+    assert git_issues.find_issues_file(search_root=tmp_path) == nested
+
+    # A memoised file that disappeared triggers a fresh discovery.
+    nested.rename(tmp_path / "issues.json")
+    assert git_issues.find_issues_file(search_root=tmp_path) == tmp_path / "issues.json"
+
+
+def test_find_issues_file_checks_env_on_every_call(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fallback = tmp_path / "git_issues.json"
+    fallback.write_text("[]", encoding="utf-8")
+    env_file = tmp_path / "exported.json"
+    monkeypatch.setenv("GIT_ISSUES_FILE", str(env_file))
+
+    assert git_issues.find_issues_file(search_root=tmp_path) == fallback
+
+    env_file.write_text("[]", encoding="utf-8")
+    assert git_issues.find_issues_file(search_root=tmp_path) == env_file
+
+
+def test_find_issues_file_search_depth_is_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_ISSUES_FILE", raising=False)
+    deep = tmp_path / "a" / "b" / "c" / "git_issues.json"
+    deep.parent.mkdir(parents=True)
+    deep.write_text("[]", encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        git_issues.find_issues_file(search_root=tmp_path)
+
+    shallow = tmp_path / "a" / "b" / "issues.json"
+    shallow.write_text("[]", encoding="utf-8")
+    assert git_issues.find_issues_file(search_root=tmp_path) == shallow
+
+
+def test_save_issues_output_is_stable(issues_file: Path) -> None:
+    issues = git_issues.load_issues(issues_file)
+    git_issues.save_issues(issues, file_path=issues_file)
+
+    expected = json.dumps(issues, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+    assert issues_file.read_text(encoding="utf-8") == expected
+
+
+def test_apply_issue_transitions(
+    issues_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GIT_ISSUES_FILE", str(issues_file))
+
+    git_issues.apply_issue_transitions()
+    saved = {issue["id"]: issue for issue in git_issues.load_issues()}
+
+    assert saved[1]["status"] == "completed"
+    assert "completed_at" in saved[1]
+    assert saved[2]["status"] == "closed"
+    assert "closed_at" in saved[2]
+    assert saved[3] == {"id": 3, "title": "Third", "state": "closed"}
+
+
+def test_apply_issue_transitions_skips_noop_write(
+    issues_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GIT_ISSUES_FILE", str(issues_file))
+    git_issues.apply_issue_transitions()
+
+    def fail_save(*args: object, **kwargs: object) -> Path:
+        raise AssertionError("save_issues should not be called")
+
+    monkeypatch.setattr(git_issues, "save_issues", fail_save)
+    git_issues.apply_issue_transitions()
+
+
+def test_transitions_share_a_batch_timestamp() -> None:
+    issues = [
+        {"id": 1, "status": "implemented"},
+        {"id": 2, "status": "implemented"},
+        {"id": 3, "status": "open"},
+    ]
+
+    git_issues.apply_issue_transitions(issues)
+
+    assert issues[0]["closed_at"] == issues[1]["closed_at"] == issues[2]["completed_at"]
+
+
+def test_save_issues_skips_unchanged_content(issues_file: Path) -> None:
+    issues = git_issues.load_issues(issues_file)
+    git_issues.save_issues(issues, file_path=issues_file)
+    first_write = issues_file.stat().st_ino
+
+    git_issues.save_issues(issues, file_path=issues_file)
+
+    assert issues_file.stat().st_ino == first_write
+
+
+def test_save_issues_writes_through_symlinks(issues_file: Path, tmp_path: Path) -> None:
+    issues_file.chmod(0o600)
+    link = tmp_path / "link.json"
+    link.symlink_to(issues_file)
+
+    git_issues.complete_open_issues(file_path=link)
+
+    assert link.is_symlink()
+    assert git_issues.load_issues(issues_file)[0]["status"] == "completed"
+    assert issues_file.stat().st_mode & 0o777 == 0o600
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "git_issues.json",
+        "link.json",
+    ]
+
+
+def test_iter_open_issues_is_lazy() -> None:
+    issues = [{"id": 1, "status": "todo"}, {"id": 2, "state": "Open"}]
+
+    iterator = git_issues.iter_open_issues(issues)
+
+    assert next(iterator)["id"] == 1
+    assert [issue["id"] for issue in iterator] == [2]
+
+
+def test_iter_open_issues_locates_the_file_eagerly(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        git_issues.iter_open_issues(file_path=tmp_path / "missing.json")
+
+
+@pytest.mark.parametrize("threshold", [0, 1 << 20])
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'[{"id": 1, "status": "open", "weight": 0.5}]',
+        b'[{"id": 1, "status": "open", "weight": NaN}]',
+        b'[{"id": 1, "status": "open"}, {"id": 2, "score": Infinity}]',
+        b'\xef\xbb\xbf[{"id": 1, "status": "open"}]',
+    ],
+)
+def test_load_issues_iter_matches_load_issues(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold: int, content: bytes
+) -> None:
+    monkeypatch.setattr(git_issues, "_STREAMING_THRESHOLD", threshold)
+    path = tmp_path / "git_issues.json"
+    path.write_bytes(content)
+
+    expected = git_issues.load_issues(path)
+    streamed = list(git_issues.load_issues_iter(path))
+
+    assert json.dumps(streamed) == json.dumps(expected)
+    assert [issue["id"] for issue in git_issues.list_open_issues(file_path=path)] == [1]
+
+
+@pytest.mark.parametrize("threshold", [0, 1 << 20])
+def test_load_issues_iter_rejects_non_list(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold: int
+) -> None:
+    monkeypatch.setattr(git_issues, "_STREAMING_THRESHOLD", threshold)
+    path = tmp_path / "git_issues.json"
+    path.write_text(json.dumps({"id": 1}))
+
+    with pytest.raises(ValueError):
+        list(git_issues.load_issues_iter(path))
+
+
+def test_load_issues_decodes_in_one_go(
+    issues_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(git_issues, "_STREAMING_THRESHOLD", 0)
+
+    def fail_stream(issues_path: Path) -> None:
+        raise AssertionError("load_issues should not stream")
+
+    monkeypatch.setattr(git_issues, "_stream_issues", fail_stream)
+
+    assert [issue["id"] for issue in git_issues.load_issues(issues_file)] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("threshold", [0, 1 << 20])
+def test_truncated_issues_file_raises_value_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold: int
+) -> None:
+    monkeypatch.setattr(git_issues, "_STREAMING_THRESHOLD", threshold)
+    path = tmp_path / "git_issues.json"
+    path.write_text(json.dumps([{"id": 1}, {"id": 2}])[:-8], encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(git_issues.load_issues_iter(path))
+
+
+def test_find_issues_file_candidate_priority(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_ISSUES_FILE", raising=False)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "git_issues.json").write_text("[]", encoding="utf-8")
+    assert git_issues.find_issues_file(search_root=tmp_path) == (
+        tmp_path / ".git" / "git_issues.json"
+    )
+
+    git_issues.find_issues_file.cache_clear()
+    for name in ("issues.json", "git_issues.json"):
+        (tmp_path / name).write_text("[]", encoding="utf-8")
+    found = git_issues.find_issues_file(search_root=tmp_path)
+    assert found == tmp_path / "git_issues.json"
+
+
+def test_transitions_return_the_given_list() -> None:
+    issues = [{"id": 1, "status": "implemented"}]
+
+    assert git_issues.close_implemented_issues(issues) is issues
+
+
+def test_load_issues_typed(issues_file: Path) -> None:
+    issues = git_issues.load_issues_typed(issues_file)
+
+    assert [issue.id for issue in issues] == [1, 2, 3]
+    assert [issue.normalised_status for issue in issues] == [
+        "open",
+        "implemented",
+        "closed",
+    ]
+    assert not hasattr(issues[0], "__dict__")
+
+
+def test_default_resolution_follows_env(
+    issues_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("GIT_ISSUES_FILE", str(issues_file))
+    assert git_issues.find_issues_file() == issues_file
+
+    other = tmp_path / "issues.json"
+    other.write_text("[]", encoding="utf-8")
+    monkeypatch.setenv("GIT_ISSUES_FILE", str(other))
+    assert git_issues.find_issues_file() == other
+
+
+def test_reset_resolver_picks_up_layout_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_ISSUES_FILE", raising=False)
+    monkeypatch.setattr(git_issues, "_MODULE_ROOT", tmp_path)
+    (tmp_path / "issues.json").write_text("[]", encoding="utf-8")
+    assert git_issues.find_issues_file() == tmp_path / "issues.json"
+
+    # A preferred candidate appearing later is only seen after a reset.
+    (tmp_path / "git_issues.json").write_text("[]", encoding="utf-8")
+    assert git_issues.find_issues_file() == tmp_path / "issues.json"
+
+    git_issues.reset_resolver()
+    assert git_issues.find_issues_file() == tmp_path / "git_issues.json"
+
+
+def test_find_issues_file_ignores_candidate_case(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GIT_ISSUES_FILE", raising=False)
+    (tmp_path / "GIT_ISSUES.JSON").write_text("[]", encoding="utf-8")
+
+    found = git_issues.find_issues_file(search_root=tmp_path)
+
+    assert found.name.lower() == "git_issues.json"
+
+
+def test_load_issues_readonly_is_cached_until_the_file_changes(
+    issues_file: Path,
+) -> None:
+    first = git_issues.load_issues_readonly(issues_file)
+    assert git_issues.load_issues_readonly(issues_file) is first
+
+    issues = git_issues.load_issues(issues_file)
+    git_issues.close_implemented_issues(issues)
+    git_issues.save_issues(issues, file_path=issues_file)
+
+    refreshed = git_issues.load_issues_readonly(issues_file)
+    assert refreshed is not first
+    assert refreshed[1]["status"] == "closed"
+
+
+def test_issues_round_trip_values_beyond_orjson_range(tmp_path: Path) -> None:
+    path = tmp_path / "git_issues.json"
+    path.write_text(
+        '[{"id": 18446744073709551617, "weight": NaN, "score": 1e400}]',
+        encoding="utf-8",
+    )
+
+    issues = git_issues.load_issues(path)
+    assert issues[0]["id"] == 2**64 + 1
+    issues.append({"id": -(2**70), "status": "open", "ratio": float("nan")})
+    git_issues.save_issues(issues, file_path=path)
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert [issue["id"] for issue in saved] == [2**64 + 1, -(2**70)]
+    assert saved[0]["weight"] != saved[0]["weight"]
+    assert saved[0]["score"] == float("inf")
+    assert saved[1]["ratio"] != saved[1]["ratio"]
+
+
+def test_transitions_keep_non_finite_floats(tmp_path: Path) -> None:
+    path = tmp_path / "git_issues.json"
+    path.write_text(
+        '[{"id": 1, "status": "implemented", "score": 1e400, "closed_at": null}]',
+        encoding="utf-8",
+    )
+
+    git_issues.close_implemented_issues(file_path=path)
+
+    assert '"score": Infinity' in path.read_text(encoding="utf-8")
+
+
+def test_blank_status_falls_back_to_state() -> None:
+    issues = [{"id": 1, "status": "  ", "state": "Open"}]
+
+    assert git_issues.list_open_issues(issues) == issues
+    assert git_issues.Issue.from_mapping(issues[0]).normalised_status == "open"
+
+    git_issues.complete_open_issues(issues)
+    assert issues[0]["status"] == issues[0]["state"] == "completed"
+
+
+def test_load_issues_readonly_cache_is_bounded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(git_issues, "_ISSUES_CACHE_MAXSIZE", 2)
+    paths = [tmp_path / f"issues-{index}.json" for index in range(3)]
+    loaded = []
+    for path in paths:
+        path.write_text('[{"id": 1}]', encoding="utf-8")
+        loaded.append(git_issues.load_issues_readonly(path))
+
+    assert git_issues.load_issues_readonly(paths[2]) is loaded[2]
+    assert git_issues.load_issues_readonly(paths[0]) is not loaded[0]